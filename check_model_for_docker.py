@@ -38,14 +38,22 @@ def check_model():
         "vocab.txt"
     ]
     
+    print("📁 Checking model files...")
+
+    # One scandir pass prefetches every entry's stat result, instead of
+    # separate exists() + stat() syscalls per required file
+    entry_sizes = {
+        entry.name: entry.stat().st_size
+        for entry in os.scandir(model_path)
+        if entry.is_file()
+    }
+
     missing_files = []
     total_size = 0
-    
-    print("📁 Checking model files...")
+
     for file_name in required_files:
-        file_path = model_path / file_name
-        if file_path.exists():
-            size_mb = file_path.stat().st_size / (1024 * 1024)
+        if file_name in entry_sizes:
+            size_mb = entry_sizes[file_name] / (1024 * 1024)
             total_size += size_mb
             print(f"   ✅ {file_name}: {size_mb:.1f} MB")
         else:
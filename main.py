@@ -1,15 +1,34 @@
 from fastapi import FastAPI, Request, UploadFile, File, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
 import uvicorn
 import os
+import numpy as np
 import pandas as pd
 import chromadb
+import torch
 from sentence_transformers import SentenceTransformer
 import uuid
+import time
+import threading
+import string
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any
 import json
 
+# PyTorch's default thread count is often wrong in containers (1, or physical
+# cores ignoring the cgroup limit); size the intra-op pool to the visible CPUs
+torch.set_num_threads(os.cpu_count() or 4)
+try:
+    torch.set_num_interop_threads(2)
+except RuntimeError:
+    # The inter-op pool can only be sized before it starts; keep the default
+    pass
+
 app = FastAPI(title="Bosch Brakes Search", version="1.0.0")
 
 # Mount static files only if directory exists
@@ -19,24 +38,223 @@ if os.path.exists("static"):
 # Initialize ChromaDB client
 chroma_client = chromadb.PersistentClient(path="./chroma_db")
 
-# Initialize sentence transformer model from local directory
-try:
-    model_path = "models/all-MiniLM-L6-v2"
-    if os.path.exists(model_path):
-        embedding_model = SentenceTransformer(model_path)
-        print("✅ Local sentence transformer model loaded successfully")
-        print(f"📁 Model location: {os.path.abspath(model_path)}")
-    else:
-        print(f"⚠️  Local model not found at: {model_path}")
-        print("💡 Using fallback to download model...")
-        # Fallback to downloading if local model doesn't exist
-        embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-        print("✅ Sentence transformer model downloaded and loaded successfully")
-except Exception as e:
-    print(f"❌ Error loading sentence transformer model: {e}")
-    print("💡 Make sure the model is available in the models/ directory")
-    print("💡 Or run 'python download_model.py' to download the model locally")
-    embedding_model = None
+# Default collection for /chat requests that don't name one; when configured,
+# the hot path never needs to list collections just to pick the first
+DEFAULT_COLLECTION = os.getenv("DEFAULT_COLLECTION")
+
+def _load_sentence_transformer(model_name_or_path):
+    """Load a SentenceTransformer, preferring the ONNX Runtime backend.
+
+    ONNX Runtime fuses the transformer graph and uses faster CPU kernels,
+    giving 2-4x lower encode latency than eager PyTorch for MiniLM. Falls
+    back to the default PyTorch backend when the installed
+    sentence-transformers has no ONNX support or the export fails.
+    """
+    try:
+        model = SentenceTransformer(model_name_or_path, backend="onnx")
+        print("⚡ Using ONNX Runtime backend for sentence encoding")
+        return model
+    except Exception as onnx_error:
+        print(f"⚠️  ONNX backend unavailable ({onnx_error})")
+        print("💡 Falling back to the PyTorch backend")
+        return SentenceTransformer(model_name_or_path)
+
+@lru_cache(maxsize=None)
+def get_embedding_model():
+    """Load the sentence transformer on first use, from the local directory.
+
+    Deferring the load keeps importing main.py cheap (healthchecks, CLI
+    tools, multi-worker startup), and with several uvicorn workers each
+    process loads the weights as its first request arrives instead of all
+    workers hammering the disk at once during boot. Returns None if the
+    model cannot be loaded.
+    """
+    try:
+        model_path = "models/all-MiniLM-L6-v2"
+        if os.path.exists(model_path):
+            model = _load_sentence_transformer(model_path)
+            print("✅ Local sentence transformer model loaded successfully")
+            print(f"📁 Model location: {os.path.abspath(model_path)}")
+        else:
+            print(f"⚠️  Local model not found at: {model_path}")
+            print("💡 Using fallback to download model...")
+            # Fallback to downloading if local model doesn't exist
+            model = _load_sentence_transformer('all-MiniLM-L6-v2')
+            print("✅ Sentence transformer model downloaded and loaded successfully")
+        return model
+    except Exception as e:
+        print(f"❌ Error loading sentence transformer model: {e}")
+        print("💡 Make sure the model is available in the models/ directory")
+        print("💡 Or run 'python download_model.py' to download the model locally")
+        return None
+
+# Cache of query text -> embedding so repeat queries skip the model forward pass.
+# Entries are evicted LRU past the max size and expire after the TTL.
+QUERY_CACHE_MAXSIZE = 2048
+QUERY_CACHE_TTL = 300  # seconds
+_query_cache = OrderedDict()
+_query_cache_lock = threading.RLock()
+
+# Punctuation maps to spaces rather than being deleted so token boundaries
+# survive: "anti-lock" stays two tokens instead of collapsing to "antilock"
+_PUNCTUATION_TABLE = str.maketrans({ch: ' ' for ch in string.punctuation})
+
+def _normalize_query(text):
+    """Canonicalize a query so near-duplicate phrasings share a cache key.
+
+    Unicode-normalizes (NFKC), lowercases, replaces punctuation with spaces
+    and collapses whitespace: queries differing only in case, spacing or
+    punctuation produce essentially identical embeddings, so they should hit
+    the same cache entry instead of each paying a model forward pass.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = text.translate(_PUNCTUATION_TABLE)
+    return " ".join(text.split())
+
+def _encode_query(text):
+    """Encode a query string, serving repeat queries from an LRU+TTL cache.
+
+    Returns a read-only numpy array: the same buffer is shared across
+    requests through the cache and must not be mutated.
+    """
+    now = time.time()
+    with _query_cache_lock:
+        entry = _query_cache.get(text)
+        if entry is not None:
+            embedding, cached_at = entry
+            if now - cached_at < QUERY_CACHE_TTL:
+                _query_cache.move_to_end(text)
+                return embedding
+            del _query_cache[text]
+
+    with torch.inference_mode():
+        embedding = get_embedding_model().encode([text], convert_to_numpy=True, normalize_embeddings=True)[0]
+    embedding.setflags(write=False)
+
+    with _query_cache_lock:
+        _query_cache[text] = (embedding, now)
+        _query_cache.move_to_end(text)
+        while len(_query_cache) > QUERY_CACHE_MAXSIZE:
+            _query_cache.popitem(last=False)
+
+    return embedding
+
+def _clear_query_cache():
+    """Drop all cached query embeddings (call after the indexed data changes)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+# Semantic cache: queries whose embedding is close enough (cosine >= threshold)
+# to a previously answered query return the cached response without touching
+# ChromaDB. Kept per collection since results depend on the collection searched.
+# Each collection's entries live in a preallocated embedding buffer written in
+# place (grown geometrically up to the cap), so inserts never copy the matrix;
+# len(results) is the number of filled rows.
+SEMANTIC_CACHE_MAXSIZE = 4096
+SEMANTIC_CACHE_INITIAL_CAPACITY = 64
+SEMANTIC_CACHE_THRESHOLD = 0.97
+_semantic_cache = {}  # collection_name -> {"embeddings", "results", "last_used"}
+_semantic_cache_lock = threading.RLock()
+
+def _semantic_cache_lookup(collection_name, query_embedding):
+    """Return a cached result whose query embedding is close to this one, or None."""
+    with _semantic_cache_lock:
+        cache = _semantic_cache.get(collection_name)
+        if cache is None or len(cache["results"]) == 0:
+            return None
+        size = len(cache["results"])
+        # Embeddings are normalized, so the dot product is cosine similarity
+        sims = cache["embeddings"][:size] @ query_embedding
+        best = int(np.argmax(sims))
+        if sims[best] >= SEMANTIC_CACHE_THRESHOLD:
+            cache["last_used"][best] = time.time()
+            return cache["results"][best]
+    return None
+
+def _semantic_cache_store(collection_name, query_embedding, result):
+    """Remember this query's result, evicting the least recently used past the cap."""
+    with _semantic_cache_lock:
+        cache = _semantic_cache.get(collection_name)
+        if cache is None:
+            cache = {
+                "embeddings": np.zeros((SEMANTIC_CACHE_INITIAL_CAPACITY, len(query_embedding)), dtype=np.float32),
+                "results": [],
+                "last_used": np.zeros(SEMANTIC_CACHE_INITIAL_CAPACITY, dtype=np.float64),
+            }
+            _semantic_cache[collection_name] = cache
+
+        size = len(cache["results"])
+        capacity = cache["embeddings"].shape[0]
+
+        if size == capacity and capacity < SEMANTIC_CACHE_MAXSIZE:
+            # Double the buffers up to the cap: amortized O(1) per insert
+            new_capacity = min(capacity * 2, SEMANTIC_CACHE_MAXSIZE)
+            for key in ("embeddings", "last_used"):
+                grown = np.zeros((new_capacity,) + cache[key].shape[1:], dtype=cache[key].dtype)
+                grown[:size] = cache[key]
+                cache[key] = grown
+            capacity = new_capacity
+
+        if size < capacity:
+            index = size
+            cache["results"].append(result)
+        else:
+            # Overwrite the least recently used entry in place
+            index = int(np.argmin(cache["last_used"]))
+            cache["results"][index] = result
+
+        cache["embeddings"][index] = query_embedding
+        cache["last_used"][index] = time.time()
+
+def _clear_semantic_cache():
+    """Drop all cached search results (call after the indexed data changes)."""
+    with _semantic_cache_lock:
+        _semantic_cache.clear()
+
+# ChromaDB lookup caches: list_collections() and get_collection() both go
+# through SQLite, so /chat was paying two metadata round-trips per request.
+# Collection handles are memoized per name and the listing is reused for a
+# short TTL; both are invalidated whenever collections are created or deleted.
+COLLECTIONS_LIST_TTL = 30  # seconds
+_collection_cache = {}  # name -> Collection handle
+_collections_list_cache = None  # (collections, cached_at)
+_collection_cache_lock = threading.RLock()
+
+def _list_collections_cached():
+    """Return the collection listing, reusing a recent result within the TTL."""
+    global _collections_list_cache
+    now = time.time()
+    with _collection_cache_lock:
+        if _collections_list_cache is not None:
+            collections, cached_at = _collections_list_cache
+            if now - cached_at < COLLECTIONS_LIST_TTL:
+                return collections
+
+    collections = chroma_client.list_collections()
+
+    with _collection_cache_lock:
+        _collections_list_cache = (collections, now)
+    return collections
+
+def _get_collection_cached(name):
+    """Return a collection handle, memoized per name."""
+    with _collection_cache_lock:
+        collection = _collection_cache.get(name)
+        if collection is not None:
+            return collection
+
+    collection = chroma_client.get_collection(name=name)
+
+    with _collection_cache_lock:
+        _collection_cache[name] = collection
+    return collection
+
+def _invalidate_collection_caches():
+    """Drop cached collection handles and the listing (call on create/delete)."""
+    global _collections_list_cache
+    with _collection_cache_lock:
+        _collection_cache.clear()
+        _collections_list_cache = None
 
 @app.get("/", response_class=HTMLResponse)
 async def chat_page():
@@ -46,47 +264,46 @@ async def chat_page():
 async def upload_page():
     return FileResponse("static/upload.html")
 
-@app.post("/chat")
-async def chat_endpoint(request: Request):
-    data = await request.json()
-    message = data.get("message", "")
-    
-    if not message:
-        return {"response": "Please provide a message to search."}
-    
-    if not embedding_model:
+def _do_chat(message, collection_name):
+    """Synchronous body of /chat; runs on the threadpool, off the event loop."""
+    if get_embedding_model() is None:
         return {"response": "Embedding model not loaded. Please check the server logs."}
-    
-    # Get the collection name from the request (default to first available)
-    collection_name = data.get("collection", None)
-    
+
     try:
-        # Get available collections
-        collections = chroma_client.list_collections()
-        
-        if not collections:
-            return {"response": "No data collections available. Please upload a CSV file first."}
-        
-        # Use specified collection or first available
+        # Resolve the collection: request value, then the configured default,
+        # then the first available (listing only consulted as a last resort)
         if not collection_name:
+            collection_name = DEFAULT_COLLECTION
+        if not collection_name:
+            collections = _list_collections_cached()
+            if not collections:
+                return {"response": "No data collections available. Please upload a CSV file first."}
             collection_name = collections[0].name
-        
-        # Get the collection
-        collection = chroma_client.get_collection(name=collection_name)
-        
-        # Convert query to embedding
-        query_embedding = embedding_model.encode([message]).tolist()[0]
-        
-        # Search in ChromaDB
+
+        # Convert query to embedding (cached; key is the normalized text so
+        # case/whitespace/punctuation variants share one entry)
+        query_embedding = _encode_query(_normalize_query(message))
+
+        # Serve near-duplicate queries (paraphrases) straight from the semantic cache
+        cached_response = _semantic_cache_lookup(collection_name, query_embedding)
+        if cached_response is not None:
+            return {"response": cached_response}
+
+        # Get the collection (memoized handle)
+        collection = _get_collection_cached(collection_name)
+
+        # Search in ChromaDB. include= is kept to exactly the fields the
+        # formatter renders below — anything more would be fetched from
+        # SQLite and serialized only to be thrown away
         results = collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embedding.reshape(1, -1),
             n_results=5,
             include=['documents', 'metadatas', 'distances']
         )
-        
+
         if not results['documents'] or not results['documents'][0]:
             return {"response": "No relevant results found for your query."}
-        
+
         # Format the response
         response_parts = []
         for i, (doc, metadata, distance) in enumerate(zip(
@@ -96,85 +313,188 @@ async def chat_endpoint(request: Request):
         )):
             similarity = 1 - distance  # Convert distance to similarity
             response_parts.append(f"**Result {i+1}** (Similarity: {similarity:.2%})\n{doc}")
-            
-            # Add metadata if available
+
+            # Add metadata if available (generator form: no intermediate list)
             if metadata:
-                metadata_str = ", ".join([f"{k}: {v}" for k, v in metadata.items() if k != 'Object_Text'])
+                metadata_str = ", ".join(f"{k}: {v}" for k, v in metadata.items() if k != 'Object_Text')
                 if metadata_str:
                     response_parts.append(f"Additional info: {metadata_str}")
-            
+
             response_parts.append("")  # Add spacing
-        
-        return {"response": "\n".join(response_parts)}
-        
+
+        response_text = "\n".join(response_parts)
+        _semantic_cache_store(collection_name, query_embedding, response_text)
+
+        return {"response": response_text}
+
     except Exception as e:
         return {"response": f"Error searching: {str(e)}"}
 
+@app.post("/chat")
+async def chat_endpoint(request: Request):
+    data = await request.json()
+    message = data.get("message", "")
+
+    if not message:
+        return {"response": "Please provide a message to search."}
+
+    # Get the collection name from the request (default to first available)
+    collection_name = data.get("collection", None)
+
+    # encode() and the ChromaDB query block; keep them off the event loop thread
+    return await run_in_threadpool(_do_chat, message, collection_name)
+
+# Rows per streamed CSV chunk; bounds peak memory regardless of file size
+UPLOAD_CHUNK_ROWS = 2000
+
+def _prepare_chunk(chunk_df):
+    """Extract documents, metadata and IDs from one CSV chunk."""
+    # Documents come from one vectorized pass instead of per-row loops
+    documents = chunk_df['Object_Text'].astype(str).tolist()
+
+    # Build row metadata (excluding Object_Text), dropping NaN values.
+    # The NaN check is one whole-frame notna() mask computed in C, not a
+    # pd.notna() call per cell; the mask also gates a fast path that skips
+    # per-record filtering entirely when the chunk has no missing values
+    meta_df = chunk_df.drop(columns=['Object_Text'])
+    notna_mask = meta_df.notna()
+    if notna_mask.values.all():
+        metadatas = meta_df.astype(str).to_dict(orient='records')
+    else:
+        meta_df = meta_df.astype(str).where(notna_mask, None)
+        metadatas = [
+            {col: val for col, val in record.items() if val is not None}
+            for record in meta_df.to_dict(orient='records')
+        ]
+
+    # Precompute IDs in one pass; .hex skips the hyphenated str() formatting
+    ids = [uuid.uuid4().hex for _ in range(len(documents))]
+
+    return documents, metadatas, ids
+
+def _encode_documents(documents):
+    """Encode a list of documents into normalized FP16 embeddings.
+
+    Duplicate texts are encoded once and their embedding fanned back out
+    per row, so chunks with repeated boilerplate skip redundant forward
+    passes entirely.
+    """
+    # CSV exports frequently repeat the same text across rows (boilerplate
+    # requirements, shared part descriptions); np.unique finds the distinct
+    # texts and the inverse index to reconstruct the per-row matrix
+    unique_texts, inverse = np.unique(np.asarray(documents, dtype=object), return_inverse=True)
+
+    # Encode the distinct texts in a single call: SentenceTransformer sorts
+    # inputs by length internally ("smart batching") so each mini-batch
+    # carries minimal padding, much faster than encoding fixed small slices.
+    # convert_to_tensor keeps the result on the compute device (GPU when
+    # available) instead of copying per mini-batch
+    with torch.inference_mode():
+        unique_embeddings = get_embedding_model().encode(
+            unique_texts.tolist(),
+            batch_size=64,
+            show_progress_bar=False,
+            convert_to_tensor=True,
+            normalize_embeddings=True
+        )
+
+    # One contiguous device->host copy for the whole chunk, then FP16. The
+    # cast only halves the in-process matrix held between encode and add —
+    # the pinned Chroma client (0.4.22) converts embeddings to Python lists
+    # before transit, so there is no wire or storage saving — but the
+    # precision loss is negligible on normalized MiniLM embeddings
+    return unique_embeddings.cpu().numpy().astype(np.float16)[inverse]
+
+def _add_chunk(collection, embeddings, documents, metadatas, ids):
+    """Add one encoded chunk to ChromaDB in 250-row slices.
+
+    250 rows per add() amortizes per-call overhead (throughput plateaus
+    around batch=100-250) while staying inside ChromaDB's recommended
+    50-250 batching window.
+    """
+    add_batch_size = 250
+    for i in range(0, len(documents), add_batch_size):
+        # The pinned client calls .tolist() on ndarrays internally, so
+        # passing the slices as-is just avoids converting them twice
+        collection.add(
+            embeddings=embeddings[i:i+add_batch_size],
+            documents=documents[i:i+add_batch_size],
+            metadatas=metadatas[i:i+add_batch_size],
+            ids=ids[i:i+add_batch_size]
+        )
+
+def _do_upload(filename, file_obj):
+    """Synchronous body of /upload; runs on the threadpool, off the event loop."""
+    if get_embedding_model() is None:
+        raise HTTPException(status_code=500, detail="Embedding model not loaded")
+
+    # Validate the header before touching ChromaDB, so a rejected or
+    # unparseable file cannot leave a stray empty collection behind
+    header_df = pd.read_csv(file_obj, nrows=0)
+    if 'Object_Text' not in header_df.columns:
+        raise HTTPException(status_code=400, detail="CSV must contain 'Object_Text' column")
+    file_obj.seek(0)
+
+    # Generate collection name from filename
+    collection_name = filename.replace('.csv', '').replace(' ', '_').lower()
+
+    # Create or get collection
+    try:
+        collection = chroma_client.create_collection(name=collection_name)
+    except:
+        collection = chroma_client.get_collection(name=collection_name)
+
+    total_records = 0
+
+    # Stream the CSV in fixed-size chunks instead of materializing the whole
+    # file: a full read_csv needs roughly 2x the file size in memory during
+    # parsing, while streaming keeps peak memory constant for any file size.
+    # Chunks move through a two-stage pipeline: while chunk i is written to
+    # ChromaDB here, chunk i+1 already encodes on the worker thread, so upload
+    # time approaches max(encode_time, add_time) instead of their sum
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None  # (embeddings future, documents, metadatas, ids)
+
+        for chunk_df in pd.read_csv(file_obj, chunksize=UPLOAD_CHUNK_ROWS):
+            documents, metadatas, ids = _prepare_chunk(chunk_df)
+            encode_future = executor.submit(_encode_documents, documents)
+
+            if pending is not None:
+                prev_future, prev_docs, prev_metas, prev_ids = pending
+                _add_chunk(collection, prev_future.result(), prev_docs, prev_metas, prev_ids)
+                total_records += len(prev_docs)
+
+            pending = (encode_future, documents, metadatas, ids)
+
+        # Flush the last in-flight chunk
+        if pending is not None:
+            encode_future, documents, metadatas, ids = pending
+            _add_chunk(collection, encode_future.result(), documents, metadatas, ids)
+            total_records += len(documents)
+
+    # Cached embeddings and search results were computed against the old
+    # index, and the upload may have created a new collection
+    _clear_query_cache()
+    _clear_semantic_cache()
+    _invalidate_collection_caches()
+
+    return {
+        "collection_name": collection_name,
+        "count": total_records,
+        "message": f"Successfully uploaded {total_records} records to collection '{collection_name}'"
+    }
+
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     if not file.filename.endswith('.csv'):
         raise HTTPException(status_code=400, detail="Only CSV files are supported")
-    
-    if not embedding_model:
-        raise HTTPException(status_code=500, detail="Embedding model not loaded")
-    
+
     try:
-        # Read CSV file
-        df = pd.read_csv(file.file)
-        
-        # Check if Object_Text column exists
-        if 'Object_Text' not in df.columns:
-            raise HTTPException(status_code=400, detail="CSV must contain 'Object_Text' column")
-        
-        # Generate collection name from filename
-        collection_name = file.filename.replace('.csv', '').replace(' ', '_').lower()
-        
-        # Create or get collection
-        try:
-            collection = chroma_client.create_collection(name=collection_name)
-        except:
-            collection = chroma_client.get_collection(name=collection_name)
-        
-        # Process data in batches
-        batch_size = 100
-        total_records = len(df)
-        processed_records = 0
-        
-        for i in range(0, total_records, batch_size):
-            batch_df = df.iloc[i:i+batch_size]
-            
-            # Prepare documents and metadata
-            documents = []
-            metadatas = []
-            ids = []
-            
-            for _, row in batch_df.iterrows():
-                # Convert row to metadata (excluding Object_Text)
-                metadata = {col: str(val) for col, val in row.items() if col != 'Object_Text' and pd.notna(val)}
-                
-                documents.append(str(row['Object_Text']))
-                metadatas.append(metadata)
-                ids.append(str(uuid.uuid4()))
-            
-            # Generate embeddings
-            embeddings = embedding_model.encode(documents).tolist()
-            
-            # Add to collection
-            collection.add(
-                embeddings=embeddings,
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
-            
-            processed_records += len(batch_df)
-        
-        return {
-            "collection_name": collection_name,
-            "count": total_records,
-            "message": f"Successfully uploaded {total_records} records to collection '{collection_name}'"
-        }
-        
+        # Parsing, encoding and indexing are all blocking CPU/I/O work;
+        # run them on the threadpool so the event loop stays responsive
+        return await run_in_threadpool(_do_upload, file.filename, file.file)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing file: {str(e)}")
 
@@ -183,14 +503,14 @@ async def get_collections():
     try:
         collections = chroma_client.list_collections()
         result = []
-        
+
         for collection in collections:
             count = collection.count()
             result.append({
                 "name": collection.name,
                 "count": count
             })
-        
+
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting collections: {str(e)}")
@@ -199,9 +519,17 @@ async def get_collections():
 async def delete_collection(collection_name: str):
     try:
         chroma_client.delete_collection(name=collection_name)
+        with _semantic_cache_lock:
+            _semantic_cache.pop(collection_name, None)
+        _invalidate_collection_caches()
         return {"message": f"Collection '{collection_name}' deleted successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting collection: {str(e)}")
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # Single worker on purpose: every process opens its own embedded
+    # PersistentClient, and Chroma caches HNSW segments per process, so a
+    # worker never sees documents another worker add()ed (and the in-process
+    # query/semantic/collection caches would go stale across workers the same
+    # way). Scale out only once Chroma runs as a separate server (HttpClient).
+    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file